@@ -2,8 +2,17 @@
 # moon_buggy_like.py — runner with wide spacing, pits, cones, big flies, and multi-level STEPS.
 # Controls: ↑ jump, Space shoot, → turbo, P pause, Q quit.
 
-import curses, time, random
-from collections import deque
+import curses, time
+from collections import defaultdict
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:   # no numba: run the same kernels as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]): return args[0]
+        return lambda f: f
 
 # ---------------- Tunables ---------------------------------------------------
 FPS                = 30
@@ -11,7 +20,7 @@ GRAVITY            = 22.0
 JUMP_VEL           = 10.0
 GROUND_PAD         = 2
 START_SPEED        = 1.0
-SPEED_UP_EVERY     = 14
+SPEED_UP_EVERY     = 14          # seconds
 SPEED_STEP         = 0.05
 
 # Hazards (all obey spacing)
@@ -31,9 +40,12 @@ BOOST_MULTIPLIER   = 2.0
 
 # Shooting and enemies
 BULLET_SPEED_COLS  = 3.0
-BULLET_COOLDOWN    = 0.10
+BULLET_COOLDOWN    = 0.10        # seconds
 ENEMY_SCORE        = 25
 ENEMY_SHIM_PER_FRAME = 0.35
+BULLET_CAP         = 64          # max bullets alive at once
+ENEMY_CAP          = 64          # max enemies alive at once
+ENEMY_BUCKET_W     = 9           # column width of the enemy spatial hash cells
 
 # Glyphs
 ROAD_CH   = "█"
@@ -57,6 +69,22 @@ CAR_ART = [
 CAR_H = len(CAR_ART)
 CAR_W = max(len(s) for s in CAR_ART)
 
+def sprite(art):
+    # (chars, mask): art padded to a char array, mask = cells its lines cover
+    width = max(len(s) for s in art)
+    chars = np.array([list(s.ljust(width)) for s in art], dtype='U1')
+    mask = np.array([[i < len(s) for i in range(width)] for s in art])
+    return chars, mask
+
+ENEMY_SPRITE = sprite(ENEMY_ART)
+CAR_SPRITE   = sprite(CAR_ART)
+
+# timers run on the frame counter, not the wall clock
+SPEED_UP_FRAMES        = int(SPEED_UP_EVERY * FPS)
+BULLET_COOLDOWN_FRAMES = max(1, round(BULLET_COOLDOWN * FPS))
+# enemy shimmy in 8.8 fixed point (1/256 column units)
+ENEMY_SHIM_FP          = int(ENEMY_SHIM_PER_FRAME * 256)
+
 def clamp(v, lo, hi): return lo if v < lo else hi if v > hi else v
 
 def max_jump_columns(speed_cols_per_frame: float) -> int:
@@ -68,85 +96,118 @@ def min_spacing(speed_cols_per_frame: float) -> int:
     return int(max_jump_columns(speed_cols_per_frame) * SPACING_FACTOR)
 
 # Each column = (cell, elev)
-#   cell: 'G' ground, 'C' cone-on-surface, ' ' pit-at-surface
+#   cell: CELL_GROUND, CELL_CONE (cone-on-surface), CELL_PIT (pit-at-surface)
 #   elev: integer 0..N (surface row = base_row - elev)
+CELL_GROUND, CELL_CONE, CELL_PIT = 0, 1, 2
+
+# TrackGen state, packed into one int array so gen_cells can update it in place
+S_WARMUP, S_COOLDOWN, S_PIT_LEFT, S_EDGE_PROTECT, S_ELEV, S_MAX_ELEV = range(6)
+
+# cumulative event thresholds: one roll per column lands in at most one band
+STEP_AT  = STEP_RATE
+PIT_AT   = STEP_AT + PIT_RATE
+CONE_AT  = PIT_AT + CONE_RATE
+ENEMY_AT = CONE_AT + ENEMY_RATE
+
+@njit(cache=True)
+def gen_cells(state, out_cells, out_elev, n, spacing, pit_cap, r):
+    # fills out_cells/out_elev[:n]; returns the column indices that spawn a fly.
+    # r[i] is column i's single uniform roll; within the step or pit band it is
+    # rescaled to a fresh uniform for the step direction / pit width
+    can_pit = (pit_cap >= PIT_MIN)
+    spawns = np.empty(n, dtype=np.int64)
+    n_spawns = 0
+    for i in range(n):
+        cell = CELL_GROUND
+        if state[S_WARMUP] > 0:
+            state[S_WARMUP] -= 1
+        elif state[S_PIT_LEFT] > 0:
+            state[S_PIT_LEFT] -= 1
+            if state[S_PIT_LEFT] == 0:
+                state[S_COOLDOWN] = spacing
+                state[S_EDGE_PROTECT] = EDGE_BUFFER
+            cell = CELL_PIT
+        elif state[S_COOLDOWN] > 0:
+            state[S_COOLDOWN] -= 1
+            if state[S_EDGE_PROTECT] > 0: state[S_EDGE_PROTECT] -= 1
+        else:
+            can_cone = (state[S_EDGE_PROTECT] == 0)
+            roll = r[i]
+            if roll < STEP_AT:
+                # step: choose up or down within bounds
+                if state[S_ELEV] == 0:
+                    up = True
+                elif state[S_ELEV] >= state[S_MAX_ELEV]:
+                    up = False
+                else:
+                    up = (roll / STEP_RATE < STEP_UP_BIAS)
+                state[S_ELEV] += 1 if up else -1
+                state[S_COOLDOWN] = spacing
+                state[S_EDGE_PROTECT] = EDGE_BUFFER   # keep edges clean
+            elif roll < PIT_AT and can_pit:
+                u = (roll - STEP_AT) / PIT_RATE
+                state[S_PIT_LEFT] = min(pit_cap, PIT_MIN + int(u * (pit_cap - PIT_MIN + 1))) - 1
+                cell = CELL_PIT
+            elif PIT_AT <= roll < CONE_AT and can_cone:
+                state[S_COOLDOWN] = spacing
+                cell = CELL_CONE
+            elif CONE_AT <= roll < ENEMY_AT:
+                state[S_COOLDOWN] = spacing
+                spawns[n_spawns] = i
+                n_spawns += 1
+            elif state[S_EDGE_PROTECT] > 0:
+                state[S_EDGE_PROTECT] -= 1
+        out_cells[i] = cell
+        out_elev[i] = state[S_ELEV]
+    return spawns[:n_spawns]
+
 class TrackGen:
     def __init__(self, width, warmup_cols, max_elev):
-        self.warmup_cols = warmup_cols
-        self.cooldown = 0
-        self.pit_left = 0
-        self.edge_protect = 0
-        self.elev = 0
-        self.max_elev = max_elev
-        self.rng = random.Random(); self.rng.seed()
-
-    def _step_event(self):
-        # choose up or down within bounds
-        if self.elev == 0:
-            up = True
-        elif self.elev >= self.max_elev:
-            up = False
-        else:
-            up = (self.rng.random() < STEP_UP_BIAS)
-        self.elev += 1 if up else -1
-
-    def next_cell(self, speed_cols_per_frame: float):
-        if self.warmup_cols > 0:
-            self.warmup_cols -= 1
-            return ('G', self.elev), None
-
-        if self.pit_left > 0:
-            self.pit_left -= 1
-            if self.pit_left == 0:
-                self.cooldown = min_spacing(speed_cols_per_frame)
-                self.edge_protect = EDGE_BUFFER
-            return (' ', self.elev), None
-
-        if self.cooldown > 0:
-            self.cooldown -= 1
-            if self.edge_protect > 0: self.edge_protect -= 1
-            return ('G', self.elev), None
-
-        # physics limits
-        J = max_jump_columns(speed_cols_per_frame)
-        pit_cap = max(PIT_MIN, min(PIT_MAX, J - 2))
-        can_pit = (pit_cap >= PIT_MIN)
-        can_cone = (self.edge_protect == 0)
-
-        r = self.rng.random()
-        # Steps
-        if r < STEP_RATE:
-            self._step_event()
-            self.cooldown = min_spacing(speed_cols_per_frame)
-            self.edge_protect = EDGE_BUFFER   # keep edges clean
-            return ('G', self.elev), None
-
-        r = self.rng.random()
-        if can_pit and r < PIT_RATE:
-            w = self.rng.randint(PIT_MIN, pit_cap)
-            self.pit_left = w - 1
-            return (' ', self.elev), None
-
-        r = self.rng.random()
-        if can_cone and r < CONE_RATE:
-            self.cooldown = min_spacing(speed_cols_per_frame)
-            return ('C', self.elev), None
-
-        r = self.rng.random()
-        if r < ENEMY_RATE:
-            self.cooldown = min_spacing(speed_cols_per_frame)
-            return ('G', self.elev), {'type':'fly'}
-
-        if self.edge_protect > 0: self.edge_protect -= 1
-        return ('G', self.elev), None
+        self.state = np.zeros(6, dtype=np.int64)
+        self.state[S_WARMUP] = warmup_cols
+        self.state[S_MAX_ELEV] = max_elev
+        self.rng = np.random.default_rng()
+
+    @property
+    def max_elev(self): return int(self.state[S_MAX_ELEV])
+    @max_elev.setter
+    def max_elev(self, v): self.state[S_MAX_ELEV] = v
 
     def advance(self, n, speed_cols_per_frame):
-        cells, enemies = [], []
-        for _ in range(n):
-            (cell, elev), enemy = self.next_cell(speed_cols_per_frame)
-            cells.append((cell, elev))
-            if enemy: enemies.append(enemy)
-        return cells, enemies
+        cells = np.empty(n, dtype=np.int8)
+        elevs = np.empty(n, dtype=np.int8)
+        # physics limits only depend on speed, so work them out once per call
+        J = max_jump_columns(speed_cols_per_frame)
+        pit_cap = max(PIT_MIN, min(PIT_MAX, J - 2))
+        r = self.rng.random(n)   # every roll for the whole call in one draw
+        spawns = gen_cells(self.state, cells, elevs, n, min_spacing(speed_cols_per_frame), pit_cap, r)
+        return cells, elevs, spawns
+
+class TrackRing:
+    # Visible track as a ring buffer over screen columns. Each ring holds the
+    # window twice (ring[:w] == ring[w:]) so ring[head:head + w] is always one
+    # contiguous view in screen order: self.cells / self.elev.
+    def __init__(self, cells, elevs):
+        self.w = len(cells)
+        self.head = 0
+        self._cells = np.concatenate((cells, cells))
+        self._elev = np.concatenate((elevs, elevs))
+        self._views()
+
+    def _views(self):
+        self.cells = self._cells[self.head:self.head + self.w]
+        self.elev = self._elev[self.head:self.head + self.w]
+
+    def push(self, cells, elevs):
+        # drop the len(cells) leftmost columns and append cells/elevs on the right
+        k = min(len(cells), self.w)
+        if k == 0: return
+        idx = (self.head + np.arange(k)) % self.w
+        for ring, new in ((self._cells, cells), (self._elev, elevs)):
+            ring[idx] = new[len(new) - k:]
+            ring[idx + self.w] = new[len(new) - k:]
+        self.head = (self.head + k) % self.w
+        self._views()
 
 class Player:
     def __init__(self, surface_row, x):
@@ -180,15 +241,55 @@ def draw_centered(stdscr, msg, row):
 def rects_overlap(ax, ay, aw, ah, bx, by, bw, bh):
     return (ax < bx + bw) and (bx < ax + aw) and (ay < by + bh) and (by < ay + ah)
 
+def bullet_enemy_hits(bx, by, ex, ey):
+    # sweep-and-prune on X: with enemies sorted by left edge, each bullet only
+    # Y-tests the enemies whose [ex, ex + ENEMY_WIDTH) span contains it
+    order = np.argsort(ex, kind='stable')
+    sx = ex[order]
+    lo = np.searchsorted(sx + ENEMY_WIDTH, bx, side='right')
+    hi = np.searchsorted(sx, bx, side='right')
+    counts = hi - lo
+    starts = np.cumsum(counts) - counts
+    bi = np.repeat(np.arange(len(bx)), counts)
+    ei = order[np.repeat(lo - starts, counts) + np.arange(int(counts.sum()))]
+    ok = (by[bi] >= ey[ei]) & (by[bi] < ey[ei] + ENEMY_HEIGHT)
+    killed = np.zeros(len(ex), dtype=bool); killed[ei[ok]] = True
+    consumed = np.zeros(len(bx), dtype=bool); consumed[bi[ok]] = True
+    return killed, consumed
+
+def bucket_by_column(xs, size):
+    # spatial hash over screen columns: cell index -> indices into xs
+    buckets = defaultdict(list)
+    for i, x in enumerate(xs):
+        buckets[x // size].append(i)
+    return buckets
+
+def blit(buf, spr, x, y):
+    # copy a sprite into buf with its top-left cell at (x, y), clipped to buf
+    chars, mask = spr
+    h, w = buf.shape
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + chars.shape[1], w), min(y + chars.shape[0], h)
+    if x0 >= x1 or y0 >= y1: return
+    m = mask[y0 - y:y1 - y, x0 - x:x1 - x]
+    buf[y0:y1, x0:x1][m] = chars[y0 - y:y1 - y, x0 - x:x1 - x][m]
+
+def compact(mask, *arrays):
+    # keep rows where mask is True, packed to the front; returns the new count
+    n = len(mask)
+    m = int(np.count_nonzero(mask))
+    for a in arrays:
+        a[:m] = a[:n][mask]
+    return m
+
 def main(stdscr):
     curses.curs_set(0)
-    stdscr.nodelay(True)
-    stdscr.timeout(0)
+    stdscr.timeout(1000 // FPS)   # getch() blocks for at most one frame
     curses.use_default_colors()
 
-    start_time = time.time()
-    last_speed_up = start_time
-    last_shot_time = -1e9
+    frame_idx = 0                 # simulated frames; drives all game timers
+    last_speed_up = 0
+    last_shot_frame = -BULLET_COOLDOWN_FRAMES
     score = 0
     best = 0
     boost = False
@@ -208,29 +309,53 @@ def main(stdscr):
     track = TrackGen(w, warmup_cols, eff_max_elev)
     speed = START_SPEED
 
-    visible = deque(maxlen=w)   # (cell, elev)
-    cells, _ = track.advance(w, speed)
-    visible.extend(cells)
+    # visible track, one entry per screen column
+    cells, elevs, _ = track.advance(w, speed)
+    visible = TrackRing(cells, elevs)
 
     scroll_acc = 0.0
-    init_surface_row = base_row - (visible[0][1] if visible else 0)
+    init_surface_row = base_row - (int(visible.elev[0]) if w else 0)
     player = Player(init_surface_row, car_x)
-    bullets = []   # {'x':float,'y':int}
-    enemies = []   # {'x':float,'y':int,'shim':int}
+    # bullets / enemies as structure-of-arrays; only [:n_*] is live
+    bullets_x  = np.empty(BULLET_CAP, dtype=np.float32)
+    bullets_y  = np.empty(BULLET_CAP, dtype=np.float32)
+    n_bullets  = 0
+    enemy_x    = np.empty(ENEMY_CAP, dtype=np.int16)    # whole columns
+    enemy_frac = np.empty(ENEMY_CAP, dtype=np.int16)    # + enemy_frac / 256
+    enemy_y    = np.empty(ENEMY_CAP, dtype=np.int16)
+    enemy_shim = np.empty(ENEMY_CAP, dtype=np.int8)
+    n_enemies  = 0
+    # their rounded screen cells, refreshed once per simulated frame
+    bx_i = by_i = ex_i = ey_i = np.empty(0, dtype=np.int32)
 
     running, paused, game_over = True, False, False
     frame_time = 1.0 / FPS
+    frame_end = time.time()
+    dirty = True                  # scene changed since the last full draw
+
+    # per-frame calls bound once, so the loop does local loads, not attribute lookups
+    getch, erase, addstr, refresh = stdscr.getch, stdscr.erase, stdscr.addstr, stdscr.refresh
+    set_timeout, cerr, clock = stdscr.timeout, curses.error, time.time
 
     while running:
-        t0 = time.time()
         nh, nw, ng, nb, ne, nx = layout()
         if (nh, nw) != (h, w) or ne != eff_max_elev:
             h, w, ground_row, base_row, eff_max_elev, car_x = nh, nw, ng, nb, ne, nx
             track.max_elev = eff_max_elev
             player.x = clamp(nx, 0, max(0, w - 1))
-            visible = deque(list(visible)[-w:], maxlen=w)
+            keep = min(visible.w, w)
+            cells, elevs, _ = track.advance(w - keep, speed)
+            visible = TrackRing(np.concatenate((visible.cells[visible.w - keep:], cells)),
+                                np.concatenate((visible.elev[visible.w - keep:], elevs)))
+            dirty = True
+
+        # waits out the rest of the previous frame; wakes early only on a key,
+        # in which case finish the wait so frames stay evenly paced
+        key = getch()
+        if key != -1 and (rest := frame_end - clock()) > 0:
+            curses.napms(int(rest * 1000))
+        frame_end = clock() + frame_time
 
-        key = stdscr.getch()
         if key != -1:
             if key in (ord('q'), 27): running = False
             elif key in (ord('p'), ord('P')): paused = not paused
@@ -239,22 +364,23 @@ def main(stdscr):
             elif key == curses.KEY_RIGHT:
                 boost = True
             elif key == ord(' '):
-                now = time.time()
-                if now - last_shot_time >= BULLET_COOLDOWN and not game_over and not paused:
-                    last_shot_time = now
-                    bullets.append({'x': float(player.x + CAR_W), 'y': int(round(player.y)) - 2})
+                if frame_idx - last_shot_frame >= BULLET_COOLDOWN_FRAMES and not game_over and not paused:
+                    last_shot_frame = frame_idx
+                    if n_bullets < BULLET_CAP:
+                        bullets_x[n_bullets] = player.x + CAR_W
+                        bullets_y[n_bullets] = int(round(player.y)) - 2
+                        n_bullets += 1
             elif key in (ord('r'), ord('R')) and game_over:
                 best = max(best, score)
                 score = 0; game_over = False; speed = START_SPEED
-                last_speed_up = time.time()
+                last_speed_up = frame_idx
                 warmup_cols = int(SAFE_START_SEC * START_SPEED * FPS) + w
                 track = TrackGen(w, warmup_cols, eff_max_elev)
-                visible.clear()
-                cells, _ = track.advance(w, speed)
-                visible.extend(cells)
-                init_surface_row = base_row - (visible[0][1] if visible else 0)
+                cells, elevs, _ = track.advance(w, speed)
+                visible = TrackRing(cells, elevs)
+                init_surface_row = base_row - (int(visible.elev[0]) if w else 0)
                 player = Player(init_surface_row, car_x)
-                bullets.clear(); enemies.clear()
+                n_bullets = n_enemies = 0
 
         if key == -1:
             boost = False
@@ -262,13 +388,13 @@ def main(stdscr):
         if paused:
             stdscr.erase()
             draw_centered(stdscr, "PAUSED  [↑] jump  [Space] shoot  [→] turbo  [Q] quit", h // 2)
-            stdscr.refresh(); time.sleep(frame_time); continue
+            stdscr.refresh(); stdscr.timeout(1000 // FPS); dirty = True; continue
 
         if not game_over:
-            now = time.time()
-            if now - last_speed_up >= SPEED_UP_EVERY:
+            frame_idx += 1
+            if frame_idx - last_speed_up >= SPEED_UP_FRAMES:
                 speed += SPEED_STEP
-                last_speed_up = now
+                last_speed_up = frame_idx
 
             current_speed = speed * (BOOST_MULTIPLIER if boost else 1.0)
 
@@ -277,154 +403,149 @@ def main(stdscr):
             cols = int(scroll_acc)
             if cols > 0:
                 scroll_acc -= cols
-                for _ in range(cols):
-                    if visible: visible.popleft()
-                cells, sp_enemies = track.advance(cols, current_speed)
-                visible.extend(cells)
+                cells, elevs, sp_enemies = track.advance(cols, current_speed)
+                visible.push(cells, elevs)
 
                 # spawn enemies at right side aligned to current surface
-                right_elev = visible[-1][1] if visible else 0
+                right_elev = int(visible.elev[-1]) if w else 0
                 surface_row_right = base_row - right_elev
                 enemy_top = max(0, surface_row_right - ENEMY_HEIGHT)
                 for _ in sp_enemies:
-                    enemies.append({'x': float(w - ENEMY_WIDTH), 'y': enemy_top, 'shim': 1})
+                    if n_enemies < ENEMY_CAP:
+                        enemy_x[n_enemies] = w - ENEMY_WIDTH
+                        enemy_frac[n_enemies] = 0
+                        enemy_y[n_enemies] = enemy_top
+                        enemy_shim[n_enemies] = 1
+                        n_enemies += 1
 
                 # shift existing enemies with world
-                for e in enemies:
-                    e['x'] -= cols
+                enemy_x[:n_enemies] -= cols
 
             # bullets
-            for b in bullets:
-                b['x'] += BULLET_SPEED_COLS
-            bullets = [b for b in bullets if b['x'] < w]
+            bullets_x[:n_bullets] += BULLET_SPEED_COLS
+            n_bullets = compact(bullets_x[:n_bullets] < w, bullets_x, bullets_y)
 
             # enemy shimmy
-            for e in enemies:
-                e['x'] += ENEMY_SHIM_PER_FRAME * e['shim']
-                e['shim'] *= -1
-            enemies = [e for e in enemies if e['x'] + ENEMY_WIDTH > 0]
+            frac = enemy_frac[:n_enemies]
+            frac += enemy_shim[:n_enemies] * np.int16(ENEMY_SHIM_FP)
+            enemy_x[:n_enemies] += frac >> 8   # carry whole columns out of the fraction
+            frac &= 0xFF
+            enemy_shim[:n_enemies] *= -1
+            n_enemies = compact(enemy_x[:n_enemies] + ENEMY_WIDTH > 0,
+                                enemy_x, enemy_frac, enemy_y, enemy_shim)
+
+            # round once; collisions and drawing share these (enemy cells are
+            # already whole columns, the fraction stays below half a column)
+            bx_i = np.rint(bullets_x[:n_bullets]).astype(np.int32)
+            by_i = np.rint(bullets_y[:n_bullets]).astype(np.int32)
+            ex_i, ey_i = enemy_x[:n_enemies], enemy_y[:n_enemies]
 
             # bullet vs enemy
-            kept = []
-            for e in enemies:
-                ex, ey = int(round(e['x'])), int(round(e['y']))
-                hit = False
-                for b in bullets:
-                    bx, by = int(round(b['x'])), int(round(b['y']))
-                    if rects_overlap(bx, by, 1, 1, ex, ey, ENEMY_WIDTH, ENEMY_HEIGHT):
-                        hit = True
-                        score += ENEMY_SCORE
-                        b['x'] = w + 999
-                        break
-                if not hit: kept.append(e)
-            enemies = kept
-            bullets = [b for b in bullets if b['x'] < w]
+            if n_bullets and n_enemies:
+                killed, consumed = bullet_enemy_hits(bx_i, by_i, ex_i, ey_i)
+                score += ENEMY_SCORE * int(np.count_nonzero(killed))
+                n_enemies = compact(~killed, enemy_x, enemy_frac, enemy_y, enemy_shim)
+                n_bullets = compact(~consumed, bullets_x, bullets_y)
+                ex_i, ey_i = enemy_x[:n_enemies], enemy_y[:n_enemies]
+                bx_i, by_i = bx_i[~consumed], by_i[~consumed]
 
             # local surface at car column
-            car_col = clamp(int(player.x), 0, w - 1)
-            elev_here = visible[car_col][1] if visible else 0
+            # (clamps inlined: these run every frame)
+            car_col = int(player.x)
+            car_col = 0 if car_col < 0 else w - 1 if car_col >= w else car_col
+            elev_here = int(visible.elev[car_col]) if w else 0
             surface_row = base_row - elev_here
 
             # player physics
             player.update(surface_row, frame_time)
 
             # lethal collisions
-            cell_here = visible[car_col][0] if visible else 'G'
+            cell_here = visible.cells[car_col] if w else CELL_GROUND
             on_ground = abs(player.y - surface_row) < 0.51
-            if on_ground and (cell_here == ' ' or cell_here == 'C'):
+            if on_ground and (cell_here == CELL_PIT or cell_here == CELL_CONE):
                 game_over = True
 
             # step-up wall: only if wheels are BELOW the next surface
-            next_col = clamp(car_col + 1, 0, w - 1)
-            elev_next = visible[next_col][1] if visible else elev_here
+            next_col = car_col + 1 if car_col + 1 < w else w - 1
+            elev_next = int(visible.elev[next_col]) if w else elev_here
             next_surface_row = base_row - elev_next
             # crash only when grounded and not already higher than (or equal to) the next surface
             if on_ground and elev_next > elev_here and player.y > next_surface_row - 0.01:
                 game_over = True
 
-            # enemy vs car AABB
+            # enemy vs car AABB, only for enemies hashed into cells the car can reach
             cx = int(player.x)
             car_bottom = int(round(player.y))
             car_top = car_bottom - (CAR_H - 1)
-            for e in enemies:
-                ex, ey = int(round(e['x'])), int(round(e['y']))
-                if rects_overlap(cx, car_top, CAR_W, CAR_H, ex, ey, ENEMY_WIDTH, ENEMY_HEIGHT):
+            ex_l, ey_l = ex_i.tolist(), ey_i.tolist()
+            buckets = bucket_by_column(ex_l, ENEMY_BUCKET_W)
+            near = [i for b in range((cx - ENEMY_WIDTH + 1) // ENEMY_BUCKET_W,
+                                     (cx + CAR_W - 1) // ENEMY_BUCKET_W + 1)
+                    for i in buckets.get(b, ())]
+            for i in near:
+                ex = ex_l[i]
+                if ex + ENEMY_WIDTH <= cx or ex >= cx + CAR_W: continue   # no X overlap
+                if rects_overlap(cx, car_top, CAR_W, CAR_H, ex, ey_l[i], ENEMY_WIDTH, ENEMY_HEIGHT):
                     game_over = True
                     break
 
             if not game_over: score += cols
+            # anything on screen that can have moved this frame forces a repaint
+            if cols or n_bullets or n_enemies or not player.on_ground or game_over:
+                dirty = True
 
         # ---------------- Draw ----------------
-        stdscr.erase()
-        # draw stacked road plus visible risers at step-ups
-        for x, (cell, elev) in enumerate(visible):
-            # base thickness column
-            try: stdscr.addch(ground_row, x, ROAD_CH)
-            except curses.error: pass
-            # fill interior up to surface
-            for k in range(1, elev):
-                ry = ground_row - k
-                if 0 <= ry < h:
-                    try: stdscr.addch(ry, x, ROAD_CH)
-                    except curses.error: pass
-            # surface row
-            surf_y = ground_row - elev
-            if cell != ' ':
-                if 0 <= surf_y < h:
-                    try: stdscr.addch(surf_y, x, ROAD_CH)
-                    except curses.error: pass
-            # riser visualization: if this column is higher than the previous, draw a vertical wall
-            if x > 0:
-                prev_elev = visible[x-1][1]
-                if elev > prev_elev:
-                    for ry in range(ground_row - elev + 1, ground_row - prev_elev + 1):
-                        if 0 <= ry < h:
-                            try: stdscr.addch(ry, x, ROAD_CH)
-                            except curses.error: pass
+        # a static scene (e.g. the game-over screen) keeps last frame's cells
+        # and only rewrites the HUD line
+        if dirty:
+            erase()
+            buf = np.full((h, w), ' ', dtype='U1')
+            # stacked road: each column is solid from its surface down to ground_row,
+            # which also covers the risers at step-ups; a pit leaves the surface open
+            surface_y = ground_row - visible.elev.astype(np.intp)
+            top = np.minimum(surface_y + (visible.cells == CELL_PIT), ground_row)
+            ys = np.arange(h)[:, None]
+            buf[(ys >= top) & (ys <= ground_row)] = ROAD_CH
             # cones exactly on surface
-            if cell == 'C':
-                cone_y = surf_y - 1
-                if 0 <= cone_y < h:
-                    try: stdscr.addch(cone_y, x, CONE_CH)
-                    except curses.error: pass
-
-        # enemies
-        for e in enemies:
-            ex, ey = int(round(e['x'])), int(round(e['y']))
-            for i, line in enumerate(ENEMY_ART):
-                ry = ey + i
-                if 0 <= ry < h:
-                    try: stdscr.addstr(ry, ex, line[: max(0, w - ex)])
-                    except curses.error: pass
-
-        # bullets
-        for b in bullets:
-            bx = int(round(b['x'])); by = int(round(b['y']))
-            if 0 <= by < h and 0 <= bx < w:
-                try: stdscr.addch(by, bx, BULLET_CH)
-                except curses.error: pass
-
-        # car
-        cx = int(player.x)
-        car_bottom = int(round(player.y))
-        car_top = car_bottom - (CAR_H - 1)
-        for i, line in enumerate(CAR_ART):
-            ry = car_top + i
-            if 0 <= ry < h:
-                try: stdscr.addstr(ry, max(0, cx), line[: max(0, w - cx)])
-                except curses.error: pass
+            cone_x = np.flatnonzero(visible.cells == CELL_CONE)
+            cone_y = surface_y[cone_x] - 1
+            on = cone_y >= 0
+            buf[cone_y[on], cone_x[on]] = CONE_CH
+
+            # bullets
+            on = (by_i >= 0) & (by_i < h) & (bx_i >= 0) & (bx_i < w)
+            buf[by_i[on], bx_i[on]] = BULLET_CH
+
+            # enemies
+            for ex, ey in zip(ex_i.tolist(), ey_i.tolist()):
+                blit(buf, ENEMY_SPRITE, ex, ey)
+
+            # car
+            cx = int(player.x)
+            car_bottom = int(round(player.y))
+            blit(buf, CAR_SPRITE, cx, car_bottom - (CAR_H - 1))
+
+            # reinterpret each row of w U1 cells as one U{w} string: no per-cell join
+            rows = buf.view(f'U{w}').ravel().tolist() if w else []
+            try:
+                for y, row in enumerate(rows):
+                    addstr(y, 0, row)
+            except cerr: pass
+        else:
+            try: stdscr.move(h - 1, 0); stdscr.clrtoeol()
+            except cerr: pass
 
         hud = f"Score {score}  Speed {speed:.2f}{' BOOST' if boost else ''}  [↑] Jump  [Space] Shoot  [→] Turbo  [P] Pause  [Q] Quit"
-        try: stdscr.addstr(h - 1, 0, hud[:w])
-        except curses.error: pass
+        try: addstr(h - 1, 0, hud[:w])
+        except cerr: pass
 
         if game_over:
             best = max(best, score)
             draw_centered(stdscr, "GAME OVER  [R]estart  [Q]uit", max(1, h // 2))
 
-        stdscr.refresh()
-        elapsed = time.time() - t0
-        if (sleep := frame_time - elapsed) > 0: time.sleep(sleep)
+        refresh()
+        dirty = False
+        set_timeout(max(0, int((frame_end - clock()) * 1000)))
 
 if __name__ == "__main__":
     try: curses.wrapper(main)